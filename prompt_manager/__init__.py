@@ -5,17 +5,27 @@ Prompt Manager: Development workflow management system with memory tracking.
 __version__ = "0.3.18"
 
 import os
-import yaml
+import sys
 import datetime
 from enum import Enum
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Tuple, Union
 from pathlib import Path
 from dataclasses import dataclass
 import json
 from prompt_manager.memory import MemoryBank
-from prompt_manager.llm_enhancement import LLMEnhancement
+from prompt_manager.serialization import dump_yaml, dumps, load_yaml, loads, write_atomic
+from prompt_manager.llm_enhancement import LLMEnhancement, digest_existing_tasks
 import uuid
 
+# Slotted dataclasses drop the per-instance __dict__ (Python 3.10+)
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Parsed tasks.json contents keyed by path, with the (mtime_ns, size) they were read at
+_TASKS_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+class CircularDependencyError(ValueError):
+    """Raised when a task dependency would create a cycle."""
+
 class TaskStatus(Enum):
     """Task status enum."""
     not_started = "not_started"
@@ -24,7 +34,7 @@ class TaskStatus(Enum):
     blocked = "blocked"
     cancelled = "cancelled"
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Task:
     id: str
     title: str
@@ -54,6 +64,8 @@ class PromptManager:
         self.tasks_file = os.path.join(self.project_path, ".prompt-manager", "tasks.json")
         self.memory = MemoryBank(memory_path or self.project_path)
         self.llm = LLMEnhancement(self.memory)
+        self._existing_tasks_digest: Optional[str] = None
+        self._title_index: Dict[str, str] = {}
         self._load_or_create_config()
         self._load_tasks()
 
@@ -68,10 +80,10 @@ class PromptManager:
                 "default_template": "default",
             }
             with open(self.config_file, "w") as f:
-                yaml.dump(self.config, f)
+                dump_yaml(self.config, f)
         else:
             with open(self.config_file, "r") as f:
-                self.config = yaml.safe_load(f)
+                self.config = load_yaml(f)
 
     def _load_tasks(self) -> Dict[str, Task]:
         """Load tasks from file."""
@@ -80,93 +92,120 @@ class PromptManager:
             self.tasks = {}
             self._save_tasks()
         else:
-            with open(self.tasks_file, "r") as f:
-                tasks_data = json.load(f)
-                self.tasks = {}
-                for task_id, task_data in tasks_data.items():
-                    self.tasks[task_id] = Task(
-                        id=task_id,
-                        title=task_data["title"],
-                        description=task_data["description"],
-                        status=TaskStatus(task_data["status"]),
-                        created_at=datetime.datetime.fromisoformat(task_data["created_at"]),
-                        updated_at=datetime.datetime.fromisoformat(task_data["updated_at"]),
-                        completed_at=datetime.datetime.fromisoformat(task_data["completed_at"]) if task_data.get("completed_at") else None,
-                        dependencies=task_data.get("dependencies", []),
-                        tags=task_data.get("tags", []),
-                        priority=task_data.get("priority", 0),
-                        notes=task_data.get("notes", [])
-                    )
+            self._existing_tasks_digest = None
+            tasks_data = self._read_tasks_file()
+            self.tasks = {}
+            # Bind the per-row constructors once for the load loop
+            fromisoformat = datetime.datetime.fromisoformat
+            for task_id, task_data in tasks_data.items():
+                completed_at = task_data.get("completed_at")
+                # Lists are copied so tasks never share them with the parse cache
+                self.tasks[task_id] = Task(
+                    id=task_id,
+                    title=task_data["title"],
+                    description=task_data["description"],
+                    status=TaskStatus(task_data["status"]),
+                    created_at=fromisoformat(task_data["created_at"]),
+                    updated_at=fromisoformat(task_data["updated_at"]),
+                    completed_at=fromisoformat(completed_at) if completed_at else None,
+                    dependencies=list(task_data.get("dependencies") or ()),
+                    tags=list(task_data.get("tags") or ()),
+                    priority=task_data.get("priority", 0),
+                    notes=list(task_data.get("notes") or ())
+                )
+        self._rebuild_title_index()
         return self.tasks
 
-    def _save_tasks(self):
-        """Save tasks to file."""
-        tasks_data = {}
+    def _rebuild_title_index(self):
+        """Map each title to the id of the first task that has it."""
+        self._title_index = {}
         for task_id, task in self.tasks.items():
-            tasks_data[task_id] = {
-                "title": task.title,
-                "description": task.description,
-                "status": task.status.value,
-                "created_at": task.created_at.isoformat(),
-                "updated_at": task.updated_at.isoformat(),
-                "completed_at": task.completed_at.isoformat() if task.completed_at else None,
-                "dependencies": task.dependencies,
-                "tags": task.tags,
-                "priority": task.priority,
-                "notes": task.notes
-            }
-        with open(self.tasks_file, "w") as f:
-            json.dump(tasks_data, f, indent=2)
+            self._title_index.setdefault(task.title, task_id)
+
+    def _find_task_id(self, title: str) -> Optional[str]:
+        """Look up a task id by title, rebuilding the index if it is stale."""
+        task_id = self._title_index.get(title)
+        task = self.tasks.get(task_id) if task_id else None
+        if task is None or task.title != title:
+            self._rebuild_title_index()
+            task_id = self._title_index.get(title)
+        return task_id
+
+    @property
+    def existing_tasks_digest(self) -> str:
+        """Digest of the current task list, recomputed only after tasks change."""
+        if self._existing_tasks_digest is None:
+            self._existing_tasks_digest = digest_existing_tasks(self.list_tasks())
+        return self._existing_tasks_digest
+
+    def _read_tasks_file(self) -> Dict[str, Any]:
+        """Parse tasks.json, reusing the last parse while the file is unchanged."""
+        st = os.stat(self.tasks_file)
+        cached = _TASKS_CACHE.get(self.tasks_file)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
+        with open(self.tasks_file, "rb") as f:
+            tasks_data = loads(f.read())
+        _TASKS_CACHE[self.tasks_file] = (st.st_mtime_ns, st.st_size, tasks_data)
+        return tasks_data
+
+    @staticmethod
+    def _serialize_task(task: Task) -> Dict[str, Any]:
+        """Build the tasks.json row for a task."""
+        return {
+            "title": task.title,
+            "description": task.description,
+            "status": task.status.value,
+            "created_at": task.created_at.isoformat(),
+            "updated_at": task.updated_at.isoformat(),
+            "completed_at": task.completed_at.isoformat() if task.completed_at else None,
+            "dependencies": list(task.dependencies),
+            "tags": list(task.tags),
+            "priority": task.priority,
+            "notes": list(task.notes)
+        }
+
+    def _save_tasks(self):
+        """Save tasks to file.
+        
+        Every task is serialized again, so changes made directly on a Task
+        are saved along with the one being recorded.
+        """
+        self._existing_tasks_digest = None
+        tasks_data = {task_id: self._serialize_task(task) for task_id, task in self.tasks.items()}
+        write_atomic(self.tasks_file, dumps(tasks_data))
+        # What was just written is what the next load would parse
+        st = os.stat(self.tasks_file)
+        _TASKS_CACHE[self.tasks_file] = (st.st_mtime_ns, st.st_size, tasks_data)
 
     def init_project(self, path: str):
         """Initialize a new project."""
-        if not os.path.exists(path):
-            os.makedirs(path)
+        root = Path(path)
+        prompt_manager_dir = root / ".prompt-manager"
+        memory_dir = root / "prompt_manager_data" / "memory"
+        templates_dir = root / "templates"
         
-        # Create .prompt-manager directory
-        prompt_manager_dir = os.path.join(path, ".prompt-manager")
-        os.makedirs(prompt_manager_dir, exist_ok=True)
+        # One mkdir per leaf directory; parents are created along the way
+        for directory in (prompt_manager_dir, memory_dir, templates_dir / "default"):
+            directory.mkdir(parents=True, exist_ok=True)
         
         # Create config file
-        config_file = os.path.join(prompt_manager_dir, "config.yaml")
         config = {
             "version": __version__,
             "memory_path": "memory",
             "templates_path": "templates",
             "default_template": "default",
         }
-        with open(config_file, "w") as f:
-            yaml.dump(config, f)
+        with open(prompt_manager_dir / "config.yaml", "w") as f:
+            dump_yaml(config, f)
         
         # Create tasks file
-        tasks_file = os.path.join(prompt_manager_dir, "tasks.json")
-        with open(tasks_file, "w") as f:
-            json.dump({}, f)
-        
-        # Create memory directory and files
-        memory_dir = os.path.join(path, "prompt_manager_data", "memory")
-        os.makedirs(memory_dir, exist_ok=True)
+        (prompt_manager_dir / "tasks.json").write_bytes(b"{}")
         
         # Create required memory files
-        context_file = os.path.join(memory_dir, "context.json")
-        with open(context_file, "w") as f:
-            json.dump({"exports": []}, f, indent=2)
-        
-        tasks_json = os.path.join(memory_dir, "tasks.json")
-        with open(tasks_json, "w") as f:
-            json.dump({}, f, indent=2)
-        
-        progress_md = os.path.join(memory_dir, "progress.md")
-        with open(progress_md, "w") as f:
-            f.write("# Progress Tracking\n\n")
-        
-        # Create templates directory
-        templates_dir = os.path.join(path, "templates")
-        os.makedirs(templates_dir, exist_ok=True)
-        
-        # Create default template directory
-        default_template_dir = os.path.join(templates_dir, "default")
-        os.makedirs(default_template_dir, exist_ok=True)
+        (memory_dir / "context.json").write_bytes(dumps({"exports": []}))
+        (memory_dir / "tasks.json").write_bytes(dumps({}))
+        (memory_dir / "progress.md").write_text("# Progress Tracking\n\n")
         
         print(f"Initialized project at {path}")
         return True
@@ -185,21 +224,24 @@ class PromptManager:
             priority=priority
         )
         self.tasks[task_id] = task
+        self._title_index.setdefault(title, task_id)
         self._save_tasks()
         return task
 
     def update_task_progress(self, title: str, status: str, note: str = "") -> Task:
         """Update task progress."""
-        task = None
-        for t in self.tasks.values():
-            if t.title == title:
-                task = t
-                break
+        task_id = self._find_task_id(title)
+        task = self.tasks[task_id] if task_id else None
         
         if not task:
             raise ValueError(f"Task '{title}' not found")
         
-        task.status = TaskStatus(status)
+        new_status = TaskStatus(status)
+        if new_status is task.status and not note:
+            # Nothing to record; leave the task and tasks.json untouched
+            return task
+        
+        task.status = new_status
         task.updated_at = datetime.datetime.now()
         
         if note:
@@ -215,12 +257,18 @@ class PromptManager:
         """List all tasks."""
         return list(self.tasks.values())
 
+    def list_tasks_by_status(self, status: TaskStatus) -> List[Task]:
+        """List tasks with the given status.
+        
+        Filtered from the tasks on each call, so status changes made
+        directly on a Task are always reflected.
+        """
+        return [task for task in self.tasks.values() if task.status is status]
+
     def get_task(self, title: str) -> Optional[Task]:
         """Get a task by title."""
-        for task in self.tasks.values():
-            if task.title == title:
-                return task
-        return None
+        task_id = self._find_task_id(title)
+        return self.tasks[task_id] if task_id else None
 
     def get_related_tasks(self, title: str) -> List[Task]:
         """Get tasks related to the given task."""
@@ -228,40 +276,44 @@ class PromptManager:
         if not task:
             return []
         
+        # Built once per call rather than once per candidate task
+        tags = set(task.tags)
+        dependencies = set(task.dependencies)
         related = []
         for t in self.tasks.values():
             if t.id != task.id:
-                if (set(t.tags) & set(task.tags)) or \
-                   (t.id in task.dependencies) or \
+                if not tags.isdisjoint(t.tags) or \
+                   (t.id in dependencies) or \
                    (task.id in t.dependencies):
                     related.append(t)
         return related
 
     def get_project_timeline(self) -> Dict[str, Any]:
         """Get project timeline information."""
-        timeline = {
-            "start_date": None,
-            "end_date": None,
-            "total_tasks": len(self.tasks),
-            "completed_tasks": 0,
-            "in_progress_tasks": 0,
-            "blocked_tasks": 0
-        }
-        
+        completed = in_progress = blocked = 0
+        start_date = end_date = None
         for task in self.tasks.values():
-            if task.status == TaskStatus.completed:
-                timeline["completed_tasks"] += 1
-            elif task.status == TaskStatus.in_progress:
-                timeline["in_progress_tasks"] += 1
-            elif task.status == TaskStatus.blocked:
-                timeline["blocked_tasks"] += 1
+            status = task.status
+            if status is TaskStatus.completed:
+                completed += 1
+            elif status is TaskStatus.in_progress:
+                in_progress += 1
+            elif status is TaskStatus.blocked:
+                blocked += 1
                 
-            if not timeline["start_date"] or task.created_at < timeline["start_date"]:
-                timeline["start_date"] = task.created_at
-            if task.completed_at and (not timeline["end_date"] or task.completed_at > timeline["end_date"]):
-                timeline["end_date"] = task.completed_at
+            if not start_date or task.created_at < start_date:
+                start_date = task.created_at
+            if task.completed_at and (not end_date or task.completed_at > end_date):
+                end_date = task.completed_at
         
-        return timeline
+        return {
+            "start_date": start_date,
+            "end_date": end_date,
+            "total_tasks": len(self.tasks),
+            "completed_tasks": completed,
+            "in_progress_tasks": in_progress,
+            "blocked_tasks": blocked
+        }
 
     def get_completion_stats(self) -> Dict[str, Any]:
         """Get task completion statistics."""
@@ -273,18 +325,23 @@ class PromptManager:
                 "blocked_rate": 0
             }
         
-        completed = sum(1 for t in self.tasks.values() if t.status == TaskStatus.completed)
-        blocked = sum(1 for t in self.tasks.values() if t.status == TaskStatus.blocked)
-        
-        completion_times = []
+        completed = 0
+        blocked = 0
+        total_hours = 0.0
+        timed = 0
         for task in self.tasks.values():
+            status = task.status
+            if status is TaskStatus.completed:
+                completed += 1
+            elif status is TaskStatus.blocked:
+                blocked += 1
             if task.completed_at:
-                completion_time = (task.completed_at - task.created_at).total_seconds() / 3600  # hours
-                completion_times.append(completion_time)
+                total_hours += (task.completed_at - task.created_at).total_seconds() / 3600
+                timed += 1
         
         return {
             "completion_rate": completed / total,
-            "average_completion_time": sum(completion_times) / len(completion_times) if completion_times else 0,
+            "average_completion_time": total_hours / timed if timed else 0,
             "blocked_rate": blocked / total
         }
 
@@ -356,7 +413,7 @@ class PromptManager:
                 if filename.endswith(".json"):
                     json.dump(tasks_data, f, indent=2)
                 elif filename.endswith(".yaml") or filename.endswith(".yml"):
-                    yaml.safe_dump(tasks_data, f)
+                    dump_yaml(tasks_data, f)
                 else:
                     # Default to JSON if no recognized extension
                     json.dump(tasks_data, f, indent=2)
@@ -381,40 +438,153 @@ class PromptManager:
         except Exception as e:
             raise Exception(f"Failed to export tasks: {str(e)}")
 
+    def add_dependency(self, task_title: str, dependency_title: str) -> None:
+        """Make one task depend on another."""
+        self.add_dependencies([(task_title, dependency_title)])
+
+    def add_dependencies(self, pairs: List[Tuple[str, str]]) -> int:
+        """Add several task dependencies, checking each for a cycle, with one save.
+        
+        Args:
+            pairs: (task title, dependency title) pairs
+            
+        Returns:
+            Number of dependencies added; already present pairs are skipped
+            
+        Raises:
+            ValueError: If a task in a pair does not exist
+            CircularDependencyError: If the new dependencies create a cycle
+        """
+        # Titles resolve to the first task with that title, as in _find_task_id
+        self._rebuild_title_index()
+        by_title = {title: self.tasks[task_id] for title, task_id in self._title_index.items()}
+        graph = {title: list(task.dependencies) for title, task in by_title.items()}
+        
+        new_edges = []
+        for task_title, dependency_title in pairs:
+            for title in (task_title, dependency_title):
+                if title not in by_title:
+                    raise ValueError(f"Task '{title}' not found")
+            if dependency_title in graph[task_title]:
+                continue
+            # The edge closes a cycle only if the dependency already leads back to the task
+            if self._depends_on(graph, dependency_title, task_title):
+                raise CircularDependencyError(
+                    f"Circular dependency detected: '{task_title}' -> '{dependency_title}'"
+                )
+            graph[task_title].append(dependency_title)
+            new_edges.append((task_title, dependency_title))
+        
+        if not new_edges:
+            return 0
+        
+        for task_title, dependency_title in new_edges:
+            by_title[task_title].dependencies.append(dependency_title)
+        self._save_tasks()
+        return len(new_edges)
+
+    @staticmethod
+    def _depends_on(graph: Dict[str, List[str]], start: str, target: str) -> bool:
+        """Return True if target is reachable from start by following dependencies."""
+        seen = {start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            if node == target:
+                return True
+            for dep in graph.get(node, ()):
+                if dep not in seen:
+                    seen.add(dep)
+                    stack.append(dep)
+        return False
+
     def delete_task(self, title: str) -> bool:
         """Delete a task."""
-        task_id = None
-        for tid, task in self.tasks.items():
-            if task.title == title:
-                task_id = tid
-                break
+        task_id = self._find_task_id(title)
         
         if not task_id:
             return False
         
         del self.tasks[task_id]
+        del self._title_index[title]
         self._save_tasks()
         return True
 
-    def generate_bolt_tasks(self, description: str, framework: Optional[str] = None) -> List[str]:
+    def generate_bolt_tasks(self, description: str, framework: Optional[str] = None,
+                            existing_tasks: Optional[List[Task]] = None,
+                            existing_digest: Optional[str] = None) -> List[str]:
         """Generate tasks for a bolt.new project.
         
         Args:
             description: Project description
             framework: Optional target framework
+            existing_tasks: Optional pre-fetched task list to use as context
+            existing_digest: Optional digest of existing_tasks for the LLM cache
             
         Returns:
             List of task descriptions
         """
         # Get existing tasks for context
-        existing_tasks = self.list_tasks()
+        if existing_tasks is None:
+            existing_tasks = self.list_tasks()
+            existing_digest = self.existing_tasks_digest
         
         # Generate tasks using LLM
         result = self.llm.generate_tasks(
             description=description,
             framework=framework,
-            existing_tasks=existing_tasks
+            existing_tasks=existing_tasks,
+            existing_digest=existing_digest
         )
         
         # Extract and return task list
         return result.get('tasks', [])
+
+    async def agenerate_bolt_tasks(self, description: str, framework: Optional[str] = None,
+                                   existing_tasks: Optional[List[Task]] = None,
+                                   existing_digest: Optional[str] = None) -> List[str]:
+        """Generate tasks for a bolt.new project asynchronously.
+        
+        Args:
+            description: Project description
+            framework: Optional target framework
+            existing_tasks: Optional pre-fetched task list to use as context
+            existing_digest: Optional digest of existing_tasks for the LLM cache
+            
+        Returns:
+            List of task descriptions
+        """
+        if existing_tasks is None:
+            existing_tasks = self.list_tasks()
+            existing_digest = self.existing_tasks_digest
+        
+        result = await self.llm.agenerate_tasks(
+            description=description,
+            framework=framework,
+            existing_tasks=existing_tasks,
+            existing_digest=existing_digest
+        )
+        return result.get('tasks', [])
+
+    async def agenerate_bolt_tasks_batch(self, descriptions: List[str],
+                                         framework: Optional[str] = None) -> List[List[str]]:
+        """Generate tasks for several bolt.new projects concurrently.
+        
+        Args:
+            descriptions: Project descriptions
+            framework: Optional target framework shared by all projects
+            
+        Returns:
+            List of task lists, in the same order as descriptions
+        """
+        # Imported here so plain CLI commands don't pay for loading asyncio
+        import asyncio
+        
+        existing_tasks = self.list_tasks()
+        existing_digest = self.existing_tasks_digest
+        # Coalesce the per-description LLM cache writes into one save
+        with self.memory.batch():
+            return await asyncio.gather(*(
+                self.agenerate_bolt_tasks(description, framework, existing_tasks, existing_digest)
+                for description in descriptions
+            ))
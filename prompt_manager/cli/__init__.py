@@ -5,16 +5,21 @@ from pathlib import Path
 from prompt_manager import PromptManager, TaskStatus, Task
 from typing import Optional
 import sys
-from prompt_manager.cli.base_commands import base
-from prompt_manager.cli.debug_commands import debug
-from prompt_manager.cli.memory_commands import memory
-from prompt_manager.cli.llm_commands import llm
-from prompt_manager.cli.repo_commands import repo
-from prompt_manager.cli.self_improvement_commands import improve
-from prompt_manager.cli.utils import get_manager
+from prompt_manager.cli.utils import LazyGroup, get_manager
 
 
-@click.group()
+# Command groups are imported on first use to keep CLI startup fast
+LAZY_SUBCOMMANDS = {
+    "base": "prompt_manager.cli.base_commands.base",
+    "debug": "prompt_manager.cli.debug_commands.debug",
+    "memory": "prompt_manager.cli.memory_commands.memory",
+    "llm": "prompt_manager.cli.llm_commands.llm",
+    "repo": "prompt_manager.cli.repo_commands.repo",
+    "improve": "prompt_manager.cli.self_improvement_commands.improve",
+}
+
+
+@click.group(cls=LazyGroup, lazy_subcommands=LAZY_SUBCOMMANDS)
 @click.version_option(version="0.3.18")
 @click.option('--project-dir', type=click.Path(exists=True), help='Project directory')
 @click.pass_context
@@ -48,15 +53,6 @@ def process_result(ctx, result, **kwargs):
     return result
 
 
-# Import and register commands
-cli.add_command(base)
-cli.add_command(debug)
-cli.add_command(memory)
-cli.add_command(llm)
-cli.add_command(repo)
-cli.add_command(improve)
-
-
 @cli.command()
 @click.option("--path", type=click.Path(), default=".")
 @click.pass_context
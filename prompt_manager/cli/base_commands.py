@@ -5,9 +5,11 @@ from pathlib import Path
 from prompt_manager import PromptManager, TaskStatus, MemoryBank
 from prompt_manager.cli.utils import get_manager, with_prompt_option
 from prompt_manager.prompts import get_prompt_for_command
-from typing import Optional
-import sys
+from prompt_manager.serialization import dump_object_stream, dumps, open_output
+from collections import Counter
+from typing import List, Optional
 import json
+import sys
 
 def print_prompt_info(prompt_name: str, prompt: str):
     """Print prompt information in a formatted way."""
@@ -139,49 +141,6 @@ def update_progress(title, status, note=None):
             }
         })
 
-@base.command()
-@with_prompt_option('list-tasks')
-def list_tasks():
-    """List all tasks."""
-    manager = get_manager()
-    tasks = manager.list_tasks()
-    
-    # Format tasks for display
-    task_list = []
-    for task in sorted(tasks, key=lambda t: (t.status.value, t.title)):
-        task_info = [f"{task.status.value}: {task.title}"]
-        if task.description:
-            task_info.append(f"  Description: {task.description}")
-        if task.priority:
-            task_info.append(f"  Priority: {task.priority}")
-        task_list.append("\n".join(task_info))
-    
-    tasks_text = "\n".join(task_list) if task_list else "No tasks found"
-    
-    # Get and format prompt
-    prompt = get_prompt_for_command("list-tasks")
-    if prompt:
-        # Calculate completion stats
-        total_tasks = len(tasks)
-        completed_tasks = sum(1 for t in tasks if t.status == TaskStatus.completed)
-        in_progress = sum(1 for t in tasks if t.status == TaskStatus.in_progress)
-        blocked = sum(1 for t in tasks if t.status == TaskStatus.blocked)
-        
-        context = {
-            "tasks": tasks_text,
-            "filter_status": "all",
-            "project_timeline": "Current project status overview",
-            "completion_stats": f"Total: {total_tasks}, Completed: {completed_tasks}, In Progress: {in_progress}, Blocked: {blocked}"
-        }
-        prompt = prompt.format(**context)
-        print_prompt_info("list-tasks", prompt)
-    
-    # Print tasks
-    if not tasks:
-        click.echo("No tasks found")
-    else:
-        click.echo(tasks_text)
-
 @base.command()
 @click.option('--output', '-o', required=True, type=click.Path(), help='Output file path')
 @with_prompt_option('export-tasks')
@@ -242,6 +201,7 @@ def generate_bolt_tasks(description: str, framework: Optional[str] = None, outpu
     """Generate tasks for a bolt.new project."""
     try:
         manager = get_manager()
+        existing_tasks = manager.list_tasks()
         
         # Get and format prompt
         prompt_template = get_prompt_for_command("generate-bolt-tasks")
@@ -249,28 +209,29 @@ def generate_bolt_tasks(description: str, framework: Optional[str] = None, outpu
             context = {
                 "description": description,
                 "framework": framework or "any",
-                "existing_tasks": "\n".join(str(task) for task in manager.list_tasks())
+                "existing_tasks": "\n".join(str(task) for task in existing_tasks)
             }
             prompt = prompt_template.format(**context)
             print_prompt_info("generate-bolt-tasks", prompt)
         
         # Generate tasks
-        result = manager.generate_bolt_tasks(description, framework)
+        result = manager.generate_bolt_tasks(description, framework, existing_tasks,
+                                             manager.existing_tasks_digest)
         
         # Print tasks to console
-        click.echo("Generated tasks:")
-        for task in result:
-            click.echo(f"- {task}")
+        lines = ["Generated tasks:"]
+        lines.extend(f"- {task}" for task in result)
+        click.echo("\n".join(lines))
         
         # Export tasks to file if output is specified
         if output:
-            task_data = {
-                'description': description,
-                'framework': framework,
-                'tasks': result
-            }
-            with open(output, 'w') as f:
-                json.dump(task_data, f, indent=2)
+            with open_output(output) as f:
+                dump_object_stream(
+                    f,
+                    {'description': description, 'framework': framework},
+                    'tasks',
+                    result
+                )
             click.echo(f"Tasks exported to {output}")
             return True
         
@@ -279,6 +240,59 @@ def generate_bolt_tasks(description: str, framework: Optional[str] = None, outpu
         click.echo(f"Error generating bolt tasks: {str(e)}", err=True)
         return False
 
+def _write_export(output: str, payload: bytes) -> None:
+    """Write an encoded export, compressing it for .zst outputs."""
+    with open_output(output) as f:
+        f.write(payload)
+
+async def _generate_and_export_batch(manager: PromptManager, descriptions: List[str],
+                                     framework: Optional[str], output: Optional[str]) -> List[List[str]]:
+    """Generate tasks for each description and write the export off the event loop."""
+    import asyncio
+    
+    results = await manager.agenerate_bolt_tasks_batch(descriptions, framework)
+    if output:
+        batch_data = [
+            {'description': description, 'framework': framework, 'tasks': tasks}
+            for description, tasks in zip(descriptions, results)
+        ]
+        await asyncio.to_thread(_write_export, output, dumps(batch_data))
+    return results
+
+@base.command()
+@click.argument('descriptions_file', type=click.Path(exists=True))
+@click.option('--framework', '-f', help='Target framework')
+@click.option('--output', help='Output file path')
+@with_prompt_option('generate-bolt-tasks')
+def generate_bolt_tasks_batch(descriptions_file: str, framework: Optional[str] = None, output: Optional[str] = None):
+    """Generate tasks for every description in a JSON list, concurrently."""
+    import asyncio
+    
+    try:
+        with open(descriptions_file) as f:
+            descriptions = json.load(f)
+        if not isinstance(descriptions, list) or not all(isinstance(d, str) for d in descriptions):
+            raise ValueError("Descriptions file must contain a JSON list of strings")
+        
+        manager = get_manager()
+        results = asyncio.run(_generate_and_export_batch(manager, descriptions, framework, output))
+        
+        # Print tasks to console
+        lines = []
+        for description, tasks in zip(descriptions, results):
+            lines.append(f"Generated tasks for: {description}")
+            lines.extend(f"- {task}" for task in tasks)
+        if lines:
+            click.echo("\n".join(lines))
+        
+        if output:
+            click.echo(f"Tasks exported to {output}")
+        
+        return True
+    except Exception as e:
+        click.echo(f"Error generating bolt tasks: {str(e)}", err=True)
+        return False
+
 @base.command()
 @click.argument('task_title')
 @click.argument('dependency_title')
@@ -288,24 +302,39 @@ def add_dependency(task_title: str, dependency_title: str):
     try:
         manager = get_manager()
         
-        # Get tasks
-        task = manager.get_task(task_title)
-        dependency = manager.get_task(dependency_title)
+        manager.add_dependency(task_title, dependency_title)
         
-        if not task or not dependency:
-            raise ValueError("Task not found")
+        click.echo(f"Added dependency: {task_title} -> {dependency_title}")
+    except Exception as e:
+        click.echo(f"Error adding dependency: {str(e)}", err=True)
+        sys.exit(1)
+
+@base.command()
+@click.argument('dependencies_file', type=click.Path(exists=True))
+@with_prompt_option('add-dependency')
+def add_dependencies(dependencies_file: str):
+    """Add dependencies from a JSON list of [task, dependency] pairs in one save."""
+    try:
+        with open(dependencies_file) as f:
+            entries = json.load(f)
+        if not isinstance(entries, list):
+            raise ValueError("Dependencies file must contain a JSON list")
         
-        # Check for circular dependencies
-        if dependency_title in task.dependencies or task_title in dependency.dependencies:
-            raise ValueError("Circular dependency detected")
+        pairs = []
+        for entry in entries:
+            if isinstance(entry, dict):
+                pairs.append((entry["task"], entry["dependency"]))
+            elif isinstance(entry, list) and len(entry) == 2:
+                pairs.append((entry[0], entry[1]))
+            else:
+                raise ValueError(f"Invalid dependency entry: {entry!r}")
         
-        # Add dependency
-        task.dependencies.append(dependency_title)
-        manager._save_tasks()
+        manager = get_manager()
+        added = manager.add_dependencies(pairs)
         
-        click.echo(f"Added dependency: {task_title} -> {dependency_title}")
+        click.echo(f"Added {added} dependencies")
     except Exception as e:
-        click.echo(f"Error adding dependency: {str(e)}", err=True)
+        click.echo(f"Error adding dependencies: {str(e)}", err=True)
         sys.exit(1)
 
 @base.command()
@@ -337,11 +366,12 @@ def list_dependencies(task_title: str):
 def list_tasks(status: Optional[str] = None, sort_by: Optional[str] = None):
     """List tasks with filtering and sorting."""
     manager = get_manager()
-    tasks = manager.list_tasks()
     
     # Apply status filter
     if status:
-        tasks = [t for t in tasks if t.status.value == status]
+        tasks = manager.list_tasks_by_status(TaskStatus(status))
+    else:
+        tasks = manager.list_tasks()
     
     # Apply sorting
     if sort_by:
@@ -367,9 +397,10 @@ def list_tasks(status: Optional[str] = None, sort_by: Optional[str] = None):
     if prompt:
         # Calculate completion stats
         total_tasks = len(tasks)
-        completed_tasks = sum(1 for t in tasks if t.status == TaskStatus.completed)
-        in_progress = sum(1 for t in tasks if t.status == TaskStatus.in_progress)
-        blocked = sum(1 for t in tasks if t.status == TaskStatus.blocked)
+        status_counts = Counter(t.status for t in tasks)
+        completed_tasks = status_counts[TaskStatus.completed]
+        in_progress = status_counts[TaskStatus.in_progress]
+        blocked = status_counts[TaskStatus.blocked]
         
         context = {
             "tasks": tasks_text,
@@ -1,13 +1,39 @@
 """Utility functions for the CLI."""
 
 import click
+import importlib
 from pathlib import Path
 import sys
 from functools import wraps
+from typing import Dict, List, Optional
 from prompt_manager import PromptManager
 from prompt_manager.memory import MemoryBank
 from prompt_manager.prompts import get_prompt_for_command
 
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules only when they are used.
+    
+    Args:
+        lazy_subcommands: Mapping of command name to "module.attribute"
+            import path of the command object
+    """
+
+    def __init__(self, *args, lazy_subcommands: Optional[Dict[str, str]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = dict(lazy_subcommands or {})
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """List eager and lazy command names."""
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Return a command, importing its module on first access."""
+        if cmd_name in self.lazy_subcommands:
+            module_name, attr_name = self.lazy_subcommands.pop(cmd_name).rsplit(".", 1)
+            command = getattr(importlib.import_module(module_name), attr_name)
+            self.add_command(command, cmd_name)
+        return super().get_command(ctx, cmd_name)
+
 def print_prompt_info(prompt_name: str, prompt: str):
     """Print prompt information in a formatted way."""
     click.echo("\n" + "="*80)
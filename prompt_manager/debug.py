@@ -88,7 +88,8 @@ class DebugManager:
         """Analyze dependencies between files."""
         dependencies = DebugManager._map_dependencies(file_paths)
         error_sources = DebugManager._identify_error_sources(dependencies, error_message) if error_message else []
-        purposes = {path: DebugManager._infer_file_purpose(path) for path in file_paths}
+        # dict.fromkeys drops repeated paths so each purpose is inferred once
+        purposes = {path: DebugManager._infer_file_purpose(path) for path in dict.fromkeys(file_paths)}
         fixes = DebugManager._suggest_cross_file_fixes(error_sources, purposes)
         
         return {
@@ -9,13 +9,49 @@ This module provides advanced LLM capabilities including:
 
 from typing import List, Dict, Optional, Tuple, Any
 from pathlib import Path
+import copy
 import json
+import hashlib
+import threading
 from datetime import datetime
 import subprocess
 import uuid
 from dataclasses import dataclass
 from prompt_manager.prompts import get_prompt_for_command
 
+# Maximum number of generated task lists kept in the response cache
+TASK_CACHE_SIZE = 128
+
+# Part of every task cache key; change it whenever the task generator changes
+# so results stored in prompts.json by the previous generator are not reused
+TASK_CACHE_VERSION = "sample-tasks-1"
+
+# Placeholder task list returned until generate_tasks calls a real LLM
+SAMPLE_TASKS = (
+    "Set up development environment",
+    "Create project structure",
+    "Install dependencies",
+    "Implement core features",
+    "Add tests",
+    "Set up deployment",
+)
+
+
+def digest_existing_tasks(existing_tasks: Optional[List[Any]]) -> str:
+    """Hash the text of existing tasks for use in the task cache key.
+
+    Args:
+        existing_tasks: Tasks passed as context to task generation
+
+    Returns:
+        str: Hex digest of the tasks' string forms
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for task in existing_tasks or []:
+        digest.update(str(task).encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
 
 @dataclass
 class PullRequestSuggestion:
@@ -68,6 +104,8 @@ class LLMEnhancement:
         self.conventions = set()
         self.command_history = []
         self.pr_suggestions: List[PullRequestSuggestion] = []
+        self._task_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._task_cache_lock = threading.Lock()
 
     @staticmethod
     def get_method_guidance(method_name: str) -> MethodGuidance:
@@ -1276,13 +1314,15 @@ When to Use:
         return {"pr": {}}
 
     def generate_tasks(self, description: str, framework: Optional[str] = None, 
-                      existing_tasks: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+                      existing_tasks: Optional[List[Dict[str, Any]]] = None,
+                      existing_digest: Optional[str] = None) -> Dict[str, Any]:
         """Generate tasks for a project.
         
         Args:
             description: Project description
             framework: Optional target framework
             existing_tasks: Optional list of existing tasks
+            existing_digest: Optional precomputed digest_existing_tasks value
             
         Returns:
             Dict containing generated tasks
@@ -1290,24 +1330,99 @@ When to Use:
         prompt = get_prompt_for_command("generate-bolt-tasks")
         if not prompt:
             return {"tasks": []}
+
+        if existing_digest is None:
+            existing_digest = digest_existing_tasks(existing_tasks)
+        cache_key = self._task_cache_key(description, framework, existing_digest, prompt)
+        with self._task_cache_lock:
+            cached = self._get_task_cache().get(cache_key)
+        if cached is not None:
+            # Copied so callers cannot change what later lookups return
+            return copy.deepcopy(cached)
+
+        existing = "\n".join(str(task) for task in (existing_tasks or []))
             
         # Format prompt with context
         context = {
             "description": description,
             "framework": framework or "any",
-            "existing_tasks": "\n".join(str(task) for task in (existing_tasks or []))
+            "existing_tasks": existing
         }
         prompt = prompt.format(**context)
         
         # TODO: Replace with actual LLM call
         # For now, return some sample tasks
-        return {
-            "tasks": [
-                "Set up development environment",
-                "Create project structure",
-                "Install dependencies",
-                "Implement core features",
-                "Add tests",
-                "Set up deployment"
-            ]
-        }
+        result = {"tasks": list(SAMPLE_TASKS)}
+        self._store_task_cache(cache_key, result)
+        return result
+
+    async def agenerate_tasks(self, description: str, framework: Optional[str] = None,
+                              existing_tasks: Optional[List[Dict[str, Any]]] = None,
+                              existing_digest: Optional[str] = None) -> Dict[str, Any]:
+        """Generate tasks for a project without blocking the event loop.
+
+        Runs generate_tasks in a worker thread so several requests can
+        wait on the LLM concurrently.
+
+        Args:
+            description: Project description
+            framework: Optional target framework
+            existing_tasks: Optional list of existing tasks
+            existing_digest: Optional precomputed digest_existing_tasks value
+
+        Returns:
+            Dict containing generated tasks
+        """
+        import asyncio
+        
+        return await asyncio.to_thread(
+            self.generate_tasks, description, framework, existing_tasks,
+            existing_digest
+        )
+
+    @staticmethod
+    def _task_cache_key(description: str, framework: Optional[str],
+                        existing_digest: str, template: str) -> str:
+        """Build the response cache key for a task generation request.
+
+        The prompt template and TASK_CACHE_VERSION are part of the key, so
+        editing the template or changing the generator misses the cache.
+        """
+        digest = hashlib.sha256()
+        for part in (TASK_CACHE_VERSION, template, description, framework or "",
+                     existing_digest):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _get_task_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load the task generation cache, seeding it from the memory bank.
+
+        Callers must hold _task_cache_lock, since agenerate_tasks runs
+        generate_tasks in worker threads.
+        """
+        if self._task_cache is None:
+            self._task_cache = {}
+            if self.memory_bank is not None:
+                try:
+                    stored = self.memory_bank.load_prompt_memory()
+                    self._task_cache.update(stored.get("task_cache", {}))
+                except Exception:
+                    pass
+        return self._task_cache
+
+    def _store_task_cache(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a generated result, evicting the oldest entries when full."""
+        with self._task_cache_lock:
+            cache = self._get_task_cache()
+            cache.pop(key, None)
+            cache[key] = copy.deepcopy(result)
+            while len(cache) > TASK_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            if self.memory_bank is not None:
+                try:
+                    stored = self.memory_bank.load_prompt_memory()
+                    stored["task_cache"] = cache
+                    self.memory_bank.save_prompt_memory(stored)
+                except Exception as e:
+                    print(f"Warning: Failed to save task cache: {e}")
@@ -6,14 +6,35 @@ configuration, and memory persistence. It serves as the central coordinator
 for the prompt management system.
 """
 
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
-import yaml
-import json
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
+import copy
+import logging
 
 from .models import Task, TaskStatus, BoltTask
 from .memory import MemoryBank
 from .debug import DebugManager
+from .serialization import dump_yaml, dumps, dumps_compact, load_yaml, load_yaml_all, loads, write_atomic
+
+logger = logging.getLogger(__name__)
+
+# Configuration files; the JSON one is preferred when both exist
+CONFIG_FILE = "prompt_config.yaml"
+CONFIG_JSON_FILE = "prompt_config.json"
+
+# Task storage file; tasks.yaml is still read when no JSON store exists yet
+TASKS_FILE = "tasks.json"
+LEGACY_TASKS_FILE = "tasks.yaml"
+
+# Append-only log of single-task changes made since tasks.json was last written
+TASKS_LOG_FILE = "tasks.jsonl"
+
+# Log entries to accumulate before folding them into tasks.json
+COMPACT_AFTER = 200
+
+# Task priorities, highest first
+PRIORITIES = ("high", "medium", "low")
 
 
 class PromptManager:
@@ -29,8 +50,12 @@ class PromptManager:
         tasks (Dict[str, Task]): Dictionary of tasks indexed by ID
         debug_mode (bool): Whether debug mode is enabled
         is_initialized (bool): Whether manager has been initialized
+        autoflush (bool): Whether mutations are saved immediately
     """
 
+    # Parsed config files keyed by resolved path, with their mtime
+    _config_cache: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+
     def __init__(
         self,
         project_name: str = "",
@@ -46,56 +71,213 @@ class PromptManager:
         """
         self.project_name = project_name
         self.memory_bank = MemoryBank(memory_path or Path.cwd() / "cline_docs")
-        self.config = config or {}
-        self.tasks: Dict[str, Task] = {}
+        self._config = config or {}
+        self._tasks: Dict[str, Task] = {}
         self.debug_mode = False
         self.is_initialized = False
+        self.autoflush = True
+        self._dirty = False
+        self._log_entries = 0
+        self._log_torn = False
+        self._tasks_hash: Optional[int] = None
+        self._markdown_hashes: Dict[str, int] = {}
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Configuration settings, with the config file loaded on first access."""
         self.initialize()
+        return self._config
+
+    @property
+    def tasks(self) -> Dict[str, Task]:
+        """Tasks indexed by title, loaded on first access."""
+        self.initialize()
+        return self._tasks
 
     def initialize(self) -> None:
-        """Initialize the prompt manager and memory bank.
+        """Initialize the prompt manager.
         
-        Loads configuration, initializes memory bank, and loads existing tasks.
-        Only runs once, subsequent calls will be ignored if already initialized.
+        Loads configuration and existing tasks. Runs on first use of config
+        or the task store; subsequent calls are ignored once initialized. The
+        memory bank creates its files when it is constructed.
         """
         if not self.is_initialized:
             self._load_config()
-            self.memory_bank.initialize()
             self.load_tasks()
             self.is_initialized = True
 
     def _load_config(self) -> None:
-        """Load configuration from prompt_config.yaml if it exists.
+        """Load configuration from prompt_config.json or prompt_config.yaml.
         
-        Updates the current config dictionary with values from the file.
+        Updates the current config dictionary with values from the file,
+        preferring the JSON file when both exist. Parsed files are cached by
+        modification time and shared between instances.
         """
-        config_path = Path("prompt_config.yaml")
-        if config_path.exists():
-            with open(config_path) as f:
-                self.config.update(yaml.safe_load(f))
+        for name, parse in ((CONFIG_JSON_FILE, loads), (CONFIG_FILE, load_yaml)):
+            config_path = Path(name)
+            try:
+                mtime = config_path.stat().st_mtime_ns
+            except FileNotFoundError:
+                continue
+            key = config_path.resolve()
+            cached = self._config_cache.get(key)
+            if cached is None or cached[0] != mtime:
+                cached = self._config_cache[key] = (mtime, parse(config_path.read_bytes()) or {})
+            self._config.update(copy.deepcopy(cached[1]))
+            return
 
     def load_tasks(self) -> None:
-        """Load tasks from tasks.yaml storage file.
+        """Load tasks from the tasks.json storage file.
         
-        Creates an empty tasks.yaml file if it doesn't exist.
+        Falls back to a legacy tasks.yaml file when tasks.json does not exist,
+        then replays any changes recorded in tasks.jsonl since the last save.
         """
-        tasks_file = Path("tasks.yaml")
+        tasks_file = Path(TASKS_FILE)
+        legacy_file = Path(LEGACY_TASKS_FILE)
         if tasks_file.exists():
-            with open(tasks_file) as f:
-                tasks_data = yaml.safe_load(f)
-                if tasks_data:
-                    for task_data in tasks_data:
-                        if task_data.get("framework"):  # BoltTask
-                            task = BoltTask.from_dict(task_data)
-                        else:  # Regular Task
-                            task = Task.from_dict(task_data)
-                        self.tasks[task.title] = task
+            for task in self._tasks_from_dicts(loads(tasks_file.read_bytes()) or []):
+                self._tasks[task.title] = task
+        elif legacy_file.exists():
+            with open(legacy_file) as f:
+                for task in self._tasks_from_yaml(f):
+                    self._tasks[task.title] = task
+        self._replay_task_log()
+
+    def _replay_task_log(self) -> None:
+        """Apply the changes recorded in tasks.jsonl to the loaded tasks.
+        
+        A last line without its newline, left by a crash during an append,
+        is skipped with a warning and the change it held is lost. The file
+        is left as it is; the next change compacts the log into tasks.json.
+        
+        Raises:
+            ValueError: If a complete line is not a valid log entry
+        """
+        log_file = Path(TASKS_LOG_FILE)
+        if not log_file.exists():
+            return
+        with open(log_file, "rb") as f:
+            lines = f.readlines()
+        
+        for number, line in enumerate(lines, 1):
+            if not line.endswith(b"\n"):
+                # Only the last line can lack its newline
+                logger.warning("Skipping incomplete last line of %s", TASKS_LOG_FILE)
+                self._log_torn = True
+                break
+            if not line.strip():
+                continue
+            try:
+                entry = loads(line)
+                op = entry["op"]
+                if op == "delete":
+                    self._tasks.pop(entry["title"], None)
+                elif op == "put":
+                    for task in self._tasks_from_dicts([entry["task"]]):
+                        self._tasks[task.title] = task
+                else:
+                    raise ValueError(f"unknown op {op!r}")
+            except (ValueError, KeyError, TypeError) as e:
+                raise ValueError(f"Invalid entry on line {number} of {TASKS_LOG_FILE}: {e}") from e
+            self._log_entries += 1
+
+    @staticmethod
+    def _tasks_from_dicts(tasks_data: List[Dict[str, Any]]) -> Iterator[Union[Task, BoltTask]]:
+        """Build tasks from serialized task dictionaries."""
+        for task_data in tasks_data:
+            if task_data.get("framework"):  # BoltTask
+                yield BoltTask.from_dict(task_data)
+            else:  # Regular Task
+                yield Task.from_dict(task_data)
+
+    @classmethod
+    def _tasks_from_yaml(cls, stream) -> Iterator[Union[Task, BoltTask]]:
+        """Build tasks from YAML, one document at a time.
+        
+        Accepts a single document holding a list of tasks, as written by
+        export_tasks, or a stream with one task per document.
+        """
+        for document in load_yaml_all(stream):
+            if isinstance(document, list):
+                yield from cls._tasks_from_dicts(document)
+            elif document:
+                yield from cls._tasks_from_dicts([document])
 
     def save_tasks(self) -> None:
-        """Save tasks to tasks.yaml storage file."""
-        tasks_data = [task.to_dict() for task in self.tasks.values()]
-        with open("tasks.yaml", "w") as f:
-            yaml.safe_dump(tasks_data, f)
+        """Save all tasks to the tasks.json storage file and clear the change log.
+        
+        The write is skipped when the serialized tasks match what this manager
+        last wrote, the file is still on disk and no change log is pending.
+        """
+        data = dumps([task.to_dict() for task in self.tasks.values()])
+        unchanged = hash(data) == self._tasks_hash and not (self._log_entries or self._log_torn)
+        if not (unchanged and Path(TASKS_FILE).exists()):
+            write_atomic(TASKS_FILE, data)
+            Path(TASKS_LOG_FILE).unlink(missing_ok=True)
+            self._tasks_hash = hash(data)
+            self._log_entries = 0
+            self._log_torn = False
+        self._dirty = False
+
+    def _append_task_log(self, entry: Dict[str, Any]) -> None:
+        """Record a single-task change in tasks.jsonl, compacting when it grows long.
+        
+        A log whose last line was left incomplete is compacted instead, so
+        the new entry does not land on the same line.
+        
+        Args:
+            entry: Log entry with an "op" of "put" or "delete"
+        """
+        if self._log_torn:
+            self.save_tasks()
+            return
+        with open(TASKS_LOG_FILE, "ab") as f:
+            f.write(dumps_compact(entry) + b"\n")
+        self._log_entries += 1
+        if self._log_entries >= COMPACT_AFTER:
+            self.save_tasks()
+
+    def flush(self) -> None:
+        """Save tasks if there are unsaved changes."""
+        if self._dirty:
+            self.save_tasks()
+
+    @contextmanager
+    def batch(self) -> Iterator["PromptManager"]:
+        """Defer task saves until the block exits, then save once.
+        
+        Yields:
+            PromptManager: This manager
+        """
+        previous = self.autoflush
+        self.autoflush = False
+        try:
+            yield self
+        finally:
+            self.autoflush = previous
+            if self.autoflush:
+                self.flush()
+
+    def _tasks_changed(self, task: Optional[Task] = None, deleted: bool = False) -> None:
+        """Record a task mutation, saving now unless inside a batch.
+        
+        A change to a single task is appended to the change log instead of
+        rewriting every task, provided nothing else is waiting to be saved.
+        Only that task is logged: edits made directly on other Task objects
+        are not persisted until save_project() or save_tasks() runs.
+        
+        Args:
+            task: The task that changed, if the change touched only one task
+            deleted: Whether the task was removed
+        """
+        if not self.autoflush:
+            self._dirty = True
+        elif task is None or self._dirty:
+            self.save_tasks()
+        elif deleted:
+            self._append_task_log({"op": "delete", "title": task.title})
+        else:
+            self._append_task_log({"op": "put", "task": task.to_dict()})
 
     def add_task(
         self,
@@ -118,7 +300,7 @@ class PromptManager:
         if title in self.tasks:
             raise ValueError(f"Task with title '{title}' already exists")
         
-        if priority not in ["low", "medium", "high"]:
+        if priority not in PRIORITIES:
             raise ValueError(f"Invalid priority '{priority}'. Must be one of: low, medium, high")
         
         task = Task(
@@ -128,7 +310,7 @@ class PromptManager:
             priority=priority,
         )
         self.tasks[title] = task
-        self.save_tasks()
+        self._tasks_changed(task)
         return task
 
     def get_task(self, task_id: Union[str, int]) -> Task:
@@ -172,11 +354,11 @@ class PromptManager:
         if template is not None:
             task.template = template
         if priority is not None:
-            if priority not in ["low", "medium", "high"]:
+            if priority not in PRIORITIES:
                 raise ValueError(f"Invalid priority '{priority}'. Must be one of: low, medium, high")
             task.priority = priority
             
-        self.save_tasks()
+        self._tasks_changed(task)
         return task
 
     def update_task_status(
@@ -203,7 +385,7 @@ class PromptManager:
                 raise ValueError(f"Invalid status '{status}'. Must be one of: {', '.join(s.value for s in TaskStatus)}")
         
         task.update_status(status, notes)
-        self.save_tasks()
+        self._tasks_changed(task)
         return task
 
     def delete_task(self, task_id: Union[str, int]) -> None:
@@ -214,7 +396,7 @@ class PromptManager:
         """
         task = self.get_task(task_id)
         del self.tasks[task.title]
-        self.save_tasks()
+        self._tasks_changed(task, deleted=True)
 
     def list_tasks(
         self,
@@ -225,26 +407,29 @@ class PromptManager:
         
         Args:
             status: Optional task status filter
-            sort_by: Optional sorting key (priority, created, updated)
+            sort_by: Optional sorting key; only "priority" is supported
         
         Returns:
             List[Task]: List of tasks
-        """
-        tasks = list(self.tasks.values())
         
+        Raises:
+            ValueError: If sort_by is not a supported key
+        """
+        if sort_by not in (None, "priority"):
+            raise ValueError(f"Invalid sort key '{sort_by}'. Must be: priority")
+
+        tasks = self.tasks.values()
         if status:
-            tasks = [t for t in tasks if t.status == status]
-            
-        if sort_by:
-            if sort_by == "priority":
-                priority_order = {"high": 0, "medium": 1, "low": 2}
-                tasks.sort(key=lambda x: priority_order[x.priority])
-            elif sort_by == "created":
-                tasks.sort(key=lambda x: x.created_at)
-            elif sort_by == "updated":
-                tasks.sort(key=lambda x: x.updated_at)
-                
-        return tasks
+            # Filtered on each call so status changes made on a Task are always seen
+            tasks = [task for task in tasks if task.status == status]
+        
+        if sort_by == "priority":
+            # Bucket by priority in one pass; stable like sort() and O(n)
+            buckets: Dict[str, List[Task]] = {p: [] for p in PRIORITIES}
+            for task in tasks:
+                buckets[task.priority].append(task)
+            return [task for p in PRIORITIES for task in buckets[p]]
+        return list(tasks)
 
     def export_tasks(self, path: Union[str, Path]) -> None:
         """Export tasks to a JSON file.
@@ -253,12 +438,11 @@ class PromptManager:
             path: Path to export file
         """
         path = Path(path)
-        tasks_data = [task.to_dict() for task in self.tasks.values()]
+        if path.suffix == '.json':
+            write_atomic(path, dumps([task.to_dict() for task in self.tasks.values()]))
+            return
         with open(path, "w") as f:
-            if path.suffix == '.json':
-                json.dump(tasks_data, f, indent=2)
-            else:
-                yaml.safe_dump(tasks_data, f)
+            dump_yaml([task.to_dict() for task in self.tasks.values()], f)
 
     def import_tasks(self, path: Union[str, Path]) -> None:
         """Import tasks from a JSON file.
@@ -267,15 +451,14 @@ class PromptManager:
             path: Path to import file
         """
         path = Path(path)
-        with open(path) as f:
-            tasks_data = yaml.safe_load(f)
-            for task_data in tasks_data:
-                if task_data.get("framework"):  # BoltTask
-                    task = BoltTask.from_dict(task_data)
-                else:  # Regular Task
-                    task = Task.from_dict(task_data)
+        with open(path) as f, self.batch():
+            if path.suffix == '.json':
+                tasks = self._tasks_from_dicts(loads(f.read()))
+            else:
+                tasks = self._tasks_from_yaml(f)
+            for task in tasks:
                 self.tasks[task.title] = task
-        self.save_tasks()
+                self._tasks_changed(task)
 
     def enable_debug(self) -> None:
         """Enable debug mode."""
@@ -318,7 +501,7 @@ class PromptManager:
         self.initialize()
 
     def save_project(self) -> None:
-        """Save project data to YAML."""
+        """Save project data to tasks.json."""
         self.save_tasks()
 
     def add_task_to_project(self, title: str, description: str, template: str) -> Task:
@@ -357,76 +540,147 @@ class PromptManager:
 
     def update_markdown_files(self) -> None:
         """Update all markdown files with current project state."""
-        self._update_project_plan()
-        self._update_task_breakdown()
-        self._update_progress_tracking()
-        self._update_mermaid_diagrams()
+        self._write_markdown(self._render_markdown_files())
+
+    def _write_markdown(self, files: List[Tuple[str, str]]) -> None:
+        """Write markdown files in turn.
+        
+        Files whose content is unchanged since this manager last wrote them
+        are skipped.
+        
+        Args:
+            files: (file name, content) pairs
+        """
+        for name, content in files:
+            content_hash = hash(content)
+            if self._markdown_hashes.get(name) == content_hash and Path(name).exists():
+                continue
+            write_atomic(name, content.encode("utf-8"))
+            self._markdown_hashes[name] = content_hash
 
     def _update_project_plan(self) -> None:
         """Update project_plan.md."""
-        content = f"# {self.project_name} Project Plan\n\n"
-        for task in self.list_tasks(sort_by="priority"):
-            content += f"## {task.title}\n"
-            content += f"Status: {task.status.value}\n"
-            content += f"Priority: {task.priority}\n"
-            content += f"\n{task.description}\n\n"
-            
-        with open("project_plan.md", "w") as f:
-            f.write(content)
+        self._write_markdown([("project_plan.md", self._render_project_plan())])
 
     def _update_task_breakdown(self) -> None:
         """Update task_breakdown.md."""
-        content = "# Task Breakdown\n\n"
-        for task in self.list_tasks():
-            content += f"## {task.title}\n"
-            content += f"- Status: {task.status.value}\n"
-            content += f"- Priority: {task.priority}\n"
-            content += f"- Created: {task.created_at.strftime('%Y-%m-%d %H:%M:%S')}\n"
-            content += f"- Updated: {task.updated_at.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-            
-        with open("task_breakdown.md", "w") as f:
-            f.write(content)
+        self._write_markdown([("task_breakdown.md", self._render_task_breakdown())])
 
     def _update_progress_tracking(self) -> None:
         """Update progress_tracking.md."""
-        content = "# Progress Tracking\n\n"
-        for task in self.list_tasks(sort_by="updated"):
-            content += f"## {task.title}\n"
-            content += f"Current Status: {task.status.value}\n\n"
-            if task.notes:
-                content += "### Notes:\n"
-                for note in task.notes:
-                    content += f"- {note}\n"
-            content += "\n"
-            
-        with open("progress_tracking.md", "w") as f:
-            f.write(content)
+        self._write_markdown([("progress_tracking.md", self._render_progress_tracking())])
 
     def _update_mermaid_diagrams(self) -> None:
         """Update mermaid_diagrams.md with current project state."""
-        content = "# Project Diagrams\n\n"
+        self._write_markdown([("mermaid_diagrams.md", self._render_mermaid_diagrams())])
+
+    def _render_markdown_files(self) -> List[Tuple[str, str]]:
+        """Build all four markdown files with one pass over the tasks.
         
-        # Task Status Flow
-        content += "## Task Status Flow\n"
-        content += "```mermaid\n"
-        content += "graph TD\n"
+        Returns:
+            List[Tuple[str, str]]: (file name, content) pairs
+        """
+        plan_buckets: Dict[str, List[str]] = {p: [] for p in PRIORITIES}
+        breakdown = ["# Task Breakdown\n\n"]
+        flow = []
         for task in self.tasks.values():
-            content += f"    {task.title}[{task.title}] --> {task.status.value}\n"
-        content += "```\n\n"
-        
-        # Task Priority Distribution
-        content += "## Task Priority Distribution\n"
-        content += "```mermaid\n"
-        content += "pie\n"
-        priorities = {"high": 0, "medium": 0, "low": 0}
+            plan_buckets[task.priority].append(self._plan_entry(task))
+            breakdown.append(self._breakdown_entry(task))
+            flow.append(self._flow_entry(task))
+        
+        plan = [f"# {self.project_name} Project Plan\n\n"]
+        for p in PRIORITIES:
+            plan.extend(plan_buckets[p])
+        progress = ["# Progress Tracking\n\n"]
+        progress.extend(map(self._progress_entry, self.tasks.values()))
+        counts = {p: len(plan_buckets[p]) for p in PRIORITIES}
+        return [
+            ("project_plan.md", "".join(plan)),
+            ("task_breakdown.md", "".join(breakdown)),
+            ("progress_tracking.md", "".join(progress)),
+            ("mermaid_diagrams.md", self._mermaid_content(flow, counts)),
+        ]
+
+    def _render_project_plan(self) -> str:
+        """Build the content of project_plan.md."""
+        parts = [f"# {self.project_name} Project Plan\n\n"]
+        parts.extend(map(self._plan_entry, self.list_tasks(sort_by="priority")))
+        return "".join(parts)
+
+    def _render_task_breakdown(self) -> str:
+        """Build the content of task_breakdown.md."""
+        parts = ["# Task Breakdown\n\n"]
+        parts.extend(map(self._breakdown_entry, self.list_tasks()))
+        return "".join(parts)
+
+    def _render_progress_tracking(self) -> str:
+        """Build the content of progress_tracking.md."""
+        parts = ["# Progress Tracking\n\n"]
+        parts.extend(map(self._progress_entry, self.tasks.values()))
+        return "".join(parts)
+
+    def _render_mermaid_diagrams(self) -> str:
+        """Build the content of mermaid_diagrams.md."""
+        counts = {p: 0 for p in PRIORITIES}
         for task in self.tasks.values():
-            priorities[task.priority] += 1
-        for priority, count in priorities.items():
-            content += f'    "{priority}" : {count}\n'
-        content += "```\n"
+            counts[task.priority] += 1
+        return self._mermaid_content(map(self._flow_entry, self.tasks.values()), counts)
+
+    @staticmethod
+    def _plan_entry(task: Task) -> str:
+        """Render one task's section of project_plan.md."""
+        return (
+            f"## {task.title}\n"
+            f"Status: {task.status.value}\n"
+            f"Priority: {task.priority}\n"
+            f"\n{task.description}\n\n"
+        )
+
+    @staticmethod
+    def _breakdown_entry(task: Task) -> str:
+        """Render one task's section of task_breakdown.md."""
+        return (
+            f"## {task.title}\n"
+            f"- Status: {task.status.value}\n"
+            f"- Priority: {task.priority}\n\n"
+        )
+
+    @staticmethod
+    def _progress_entry(task: Task) -> str:
+        """Render one task's section of progress_tracking.md."""
+        parts = [f"## {task.title}\n", f"Current Status: {task.status.value}\n\n"]
+        if task.status_notes:
+            parts.append("### Notes:\n")
+            for note in task.status_notes:
+                parts.append(f"- {note}\n")
+        parts.append("\n")
+        return "".join(parts)
+
+    @staticmethod
+    def _flow_entry(task: Task) -> str:
+        """Render one task's line of the status flow diagram."""
+        return f"    {task.title}[{task.title}] --> {task.status.value}\n"
+
+    @staticmethod
+    def _mermaid_content(flow: Iterable[str], counts: Dict[str, int]) -> str:
+        """Build mermaid_diagrams.md from status flow lines and priority counts."""
+        parts = ["# Project Diagrams\n\n"]
         
-        with open("mermaid_diagrams.md", "w") as f:
-            f.write(content)
+        # Task Status Flow
+        parts.append("## Task Status Flow\n")
+        parts.append("```mermaid\n")
+        parts.append("graph TD\n")
+        parts.extend(flow)
+        parts.append("```\n\n")
+        
+        # Task Priority Distribution
+        parts.append("## Task Priority Distribution\n")
+        parts.append("```mermaid\n")
+        parts.append("pie\n")
+        for priority, count in counts.items():
+            parts.append(f'    "{priority}" : {count}\n')
+        parts.append("```\n")
+        return "".join(parts)
 
     def handle_task_failure(self, task: Task, error_message: str) -> None:
         """Handle task failure.
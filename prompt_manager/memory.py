@@ -6,12 +6,15 @@ across development sessions. It handles file-based storage with token limits
 and section management.
 """
 
+from contextlib import contextmanager
 from pathlib import Path
 import json
 import os
 import shutil
 import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional
+
+from prompt_manager.serialization import dumps, loads
 
 class MemoryBank:
     """Manages persistent memory and context for the development workflow.
@@ -37,6 +40,7 @@ class MemoryBank:
         self.context_file = self.memory_dir / "context.json"
         self.progress_file = self.memory_dir / "progress.md"
         self.backup_dir = self.memory_dir / "backups"
+        self._staged: Optional[Dict[Path, dict]] = None
         
         # Initialize memory files if they don't exist
         self._init_memory_files()
@@ -79,16 +83,37 @@ class MemoryBank:
         """Update context memory with new data."""
         context = self.load_context_memory()
         context.update(update)
-        self.save_context_memory(context)
+        self._write_file(self.context_file, context)
 
     def update_progress(self, message: str) -> None:
         """Update progress tracking file."""
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = datetime.datetime.now().isoformat(sep=" ", timespec="seconds")
         entry = f"\n## {timestamp}\n{message}\n"
         
         with open(self.progress_file, "a") as f:
             f.write(entry)
 
+    @contextmanager
+    def batch(self) -> Iterator["MemoryBank"]:
+        """Stage memory writes and flush them once per file on exit.
+        
+        Loads inside the block see the staged data.
+        
+        Yields:
+            MemoryBank: This memory bank
+        """
+        if self._staged is not None:
+            yield self
+            return
+        
+        self._staged = {}
+        try:
+            yield self
+        finally:
+            staged, self._staged = self._staged, None
+            for file_path, data in staged.items():
+                self._write_file(file_path, data)
+
     def create_backup(self) -> str:
         """Create a backup of all memory files.
         
@@ -143,18 +168,30 @@ class MemoryBank:
             current_data.update(data)
             
             # Write back to file
-            with open(file_path, "w") as f:
-                json.dump(current_data, f, indent=2)
+            self._write_file(file_path, current_data)
+        except Exception as e:
+            print(f"Warning: Failed to save to {file_path.name}: {e}")
+
+    def _write_file(self, file_path: Path, data: dict):
+        """Write data to a JSON file, replacing its contents."""
+        if self._staged is not None:
+            self._staged[file_path] = data
+            return
+        try:
+            with open(file_path, "wb") as f:
+                f.write(dumps(data))
         except Exception as e:
             print(f"Warning: Failed to save to {file_path.name}: {e}")
 
     def _load_from_file(self, file_path: Path) -> dict:
         """Load data from a JSON file."""
+        if self._staged is not None and file_path in self._staged:
+            return dict(self._staged[file_path])
         try:
             if not file_path.exists():
                 return {}
-            with open(file_path, "r") as f:
-                return json.load(f) or {}
+            with open(file_path, "rb") as f:
+                return loads(f.read()) or {}
         except Exception as e:
             print(f"Warning: Failed to load from {file_path.name}: {e}")
             return {}
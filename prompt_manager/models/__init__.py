@@ -2,11 +2,18 @@
 Models for the prompt manager.
 """
 
+import sys
 from dataclasses import dataclass, field, fields
 from enum import Enum
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
+# Slotted dataclasses drop the per-instance __dict__ (Python 3.10+)
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Valid priorities; from_dict interns loaded values so tasks share one string each
+_VALID_PRIORITIES = frozenset(("low", "medium", "high"))
+
 
 class TaskStatus(Enum):
     """Task status."""
@@ -24,7 +31,7 @@ class TaskStatus(Enum):
             raise ValueError(f"Invalid status: {status}. Must be one of: {[s.value for s in cls]}")
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Task:
     """Task model."""
     title: str
@@ -47,7 +54,7 @@ class Task:
             raise ValueError("Template must be a string")
         if not isinstance(self.priority, str):
             raise ValueError("Priority must be a string")
-        if self.priority.lower() not in ["low", "medium", "high"]:
+        if self.priority.lower() not in _VALID_PRIORITIES:
             raise ValueError("Priority must be one of: low, medium, high")
         if self.due_date:
             try:
@@ -93,7 +100,7 @@ class Task:
             description=data.get('description', ''),
             template=data.get('template', ''),
             status=status,
-            priority=data.get('priority', 'medium').lower(),
+            priority=sys.intern(data.get('priority', 'medium').lower()),
             dependencies=data.get('dependencies', []),
             assignee=data.get('assignee'),
             due_date=data.get('due_date'),
@@ -113,7 +120,7 @@ class Task:
             self.status_notes.append(f"[{timestamp}] Status changed from {old_status.value} to {new_status.value}: {note}")
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class BoltTask:
     """Bolt task model."""
     title: str
@@ -140,7 +147,7 @@ class BoltTask:
             raise ValueError("bolt_type must be a non-empty string")
         if not isinstance(self.bolt_priority, int):
             raise ValueError("bolt_priority must be an integer")
-        if self.priority.lower() not in ["low", "medium", "high"]:
+        if self.priority.lower() not in _VALID_PRIORITIES:
             raise ValueError("priority must be one of: low, medium, high")
         if self.bolt_due_date:
             try:
@@ -196,7 +203,7 @@ class BoltTask:
             bolt_status=data["bolt_status"],
             bolt_priority=int(data["bolt_priority"]),
             description=data.get("description"),
-            priority=data.get("priority", "medium").lower(),
+            priority=sys.intern(data.get("priority", "medium").lower()),
             status=status,
             dependencies=data.get("dependencies", []),
             subtasks=[cls.from_dict(t) for t in data.get("subtasks", [])],
@@ -1,11 +1,12 @@
 """Module for managing LLM prompts and templates."""
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
-import yaml
 import os
 
+from prompt_manager.serialization import load_yaml
+
 class PromptTemplate:
     def __init__(self, name: str, template: str, required_context: List[str], description: str = ""):
         self.name = name
@@ -25,7 +26,7 @@ class PromptTemplate:
     def from_yaml(cls, yaml_path: Path) -> 'PromptTemplate':
         """Load a prompt template from a YAML file."""
         with open(yaml_path) as f:
-            data = yaml.safe_load(f)
+            data = load_yaml(f)
             
         return cls(
             name=data['name'],
@@ -37,41 +38,54 @@ class PromptTemplate:
 class PromptManager:
     def __init__(self):
         self.templates: Dict[str, PromptTemplate] = {}
+        self._fingerprint: Tuple[Tuple[str, int], ...] = ()
         self._load_templates()
     
-    def _load_templates(self):
-        """Load all templates from the templates directory."""
+    def _template_dirs(self) -> List[Path]:
+        """Template directories in load order; later ones override earlier."""
         # Get the templates directory relative to this file
-        base_dir = Path(__file__).parent
-        templates_dir = base_dir / 'templates'
-        
-        # Load default templates first
-        default_dir = templates_dir / 'default'
-        if default_dir.exists():
-            self._load_directory(default_dir)
-        
-        # Load custom templates (overriding defaults if same name)
-        custom_dir = templates_dir / 'custom'
-        if custom_dir.exists():
-            self._load_directory(custom_dir)
-        
-        # Load project-specific templates if in a project
-        cwd = Path.cwd()
-        project_templates = cwd / 'prompt_templates'
-        if project_templates.exists():
-            self._load_directory(project_templates)
+        templates_dir = Path(__file__).parent / 'templates'
+        return [
+            templates_dir / 'default',
+            templates_dir / 'custom',
+            # Project-specific templates if in a project
+            Path.cwd() / 'prompt_templates',
+        ]
     
-    def _load_directory(self, directory: Path):
-        """Load all YAML templates from a directory."""
-        if not directory.exists():
-            return
-            
-        for file in directory.glob('*.yaml'):
+    def _template_files(self) -> List[Path]:
+        """All template files, in load order."""
+        files = []
+        for directory in self._template_dirs():
+            if directory.exists():
+                files.extend(directory.glob('*.yaml'))
+        return files
+    
+    def _compute_fingerprint(self, files: List[Path]) -> Tuple[Tuple[str, int], ...]:
+        """Identify the current template files by path and modification time."""
+        fingerprint = []
+        for file in files:
+            try:
+                fingerprint.append((str(file), file.stat().st_mtime_ns))
+            except OSError:
+                continue
+        return tuple(fingerprint)
+    
+    def _load_templates(self):
+        """Load all templates from the templates directories."""
+        files = self._template_files()
+        self.templates = {}
+        for file in files:
             try:
                 template = PromptTemplate.from_yaml(file)
                 self.templates[template.name] = template
             except Exception as e:
                 print(f"Error loading template {file}: {e}")
+        self._fingerprint = self._compute_fingerprint(files)
+    
+    def reload_if_changed(self):
+        """Reload templates only if a template file was added, removed or modified."""
+        if self._compute_fingerprint(self._template_files()) != self._fingerprint:
+            self._load_templates()
     
     def get_template(self, name: str) -> Optional[PromptTemplate]:
         """Get a prompt template by name."""
@@ -123,8 +137,8 @@ def get_prompt_for_command(command_name: str) -> str:
     Returns:
         Formatted prompt string
     """
-    manager = PromptManager()
-    template = manager.get_template(command_name)
+    _prompt_manager.reload_if_changed()
+    template = _prompt_manager.get_template(command_name)
     if template:
         # Display prompt to user
         print_prompt_info(command_name, template.template)
@@ -133,4 +147,5 @@ def get_prompt_for_command(command_name: str) -> str:
 
 def list_available_templates() -> List[Dict[str, str]]:
     """List all available prompt templates."""
+    _prompt_manager.reload_if_changed()
     return _prompt_manager.list_templates()
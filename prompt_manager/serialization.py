@@ -0,0 +1,232 @@
+"""
+JSON and YAML serialization helpers for the prompt manager.
+
+Probes for orjson, then ujson, and falls back to the standard library,
+so the faster backends stay optional dependencies. YAML goes through the
+libyaml bindings when PyYAML was built with them.
+"""
+
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import IO, Any, BinaryIO, Iterable, Iterator, Mapping
+
+import yaml
+
+try:
+    import orjson
+    _ORJSON_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover - depends on the environment
+    ujson = None
+
+try:
+    from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader
+
+ZSTD_SUFFIX = ".zst"
+ZSTD_LEVEL = 3
+
+
+def dumps(data: Any) -> bytes:
+    """Serialize data to indented, newline-terminated JSON bytes.
+
+    Args:
+        data: JSON-serializable object
+
+    Returns:
+        bytes: UTF-8 encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=_ORJSON_OPTS)
+    if ujson is not None:
+        return (ujson.dumps(data, indent=2) + "\n").encode("utf-8")
+    return (json.dumps(data, indent=2) + "\n").encode("utf-8")
+
+
+def loads(data: bytes) -> Any:
+    """Deserialize JSON bytes.
+
+    Args:
+        data: UTF-8 encoded JSON document
+
+    Returns:
+        Any: Decoded object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if ujson is not None:
+        return ujson.loads(data)
+    return json.loads(data)
+
+
+def load_yaml(stream: IO) -> Any:
+    """Parse a YAML document with the safe loader.
+
+    Args:
+        stream: Text stream or string to parse
+
+    Returns:
+        Any: Decoded object
+    """
+    return yaml.load(stream, Loader=YamlLoader)
+
+
+def dump_yaml(data: Any, stream: IO) -> None:
+    """Write data as YAML with the safe dumper.
+
+    Args:
+        data: Object to serialize
+        stream: Text stream to write to
+    """
+    yaml.dump(data, stream, Dumper=YamlDumper)
+
+
+def load_yaml_all(stream: IO) -> Iterator[Any]:
+    """Parse a YAML stream lazily, one document at a time.
+
+    Args:
+        stream: Text stream or string to parse
+
+    Yields:
+        Any: Each decoded document
+    """
+    return yaml.load_all(stream, Loader=YamlLoader)
+
+
+def dumps_compact(data: Any) -> bytes:
+    """Serialize data to compact JSON bytes without a trailing newline.
+
+    Args:
+        data: JSON-serializable object
+
+    Returns:
+        bytes: UTF-8 encoded JSON value
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    if ujson is not None:
+        return ujson.dumps(data).encode("utf-8")
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def dump_object_stream(fp: BinaryIO, fields: Mapping[str, Any],
+                       list_key: str, items: Iterable[Any]) -> None:
+    """Write a JSON object whose last member is a list, one item at a time.
+
+    Only a single list element is serialized at any moment, so large lists
+    never need a full in-memory copy of the encoded document.
+
+    Args:
+        fp: Binary file object to write to
+        fields: Scalar members written before the list
+        list_key: Name of the list member
+        items: List elements to stream
+    """
+    fp.write(b"{")
+    for key, value in fields.items():
+        fp.write(dumps_compact(key))
+        fp.write(b":")
+        fp.write(dumps_compact(value))
+        fp.write(b",")
+    fp.write(dumps_compact(list_key))
+    fp.write(b":[")
+    for index, item in enumerate(items):
+        if index:
+            fp.write(b",")
+        fp.write(dumps_compact(item))
+    fp.write(b"]}\n")
+
+
+@contextmanager
+def open_output(path: str) -> Iterator[BinaryIO]:
+    """Open a buffered binary file for writing, zstd-compressed for .zst paths.
+
+    Args:
+        path: Output file path
+
+    Yields:
+        BinaryIO: Writable binary file object
+
+    Raises:
+        ValueError: If a .zst path is given and zstandard is not installed
+    """
+    if not str(path).endswith(ZSTD_SUFFIX):
+        with open(path, "wb", buffering=1 << 20) as f:
+            yield f
+        return
+
+    try:
+        import zstandard
+    except ImportError:
+        raise ValueError(
+            "Writing .zst files requires the 'zstandard' package "
+            "(pip install tosins-prompt-manager[speedups])"
+        )
+    with open(path, "wb") as f:
+        compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+        with compressor.stream_writer(f, closefd=False) as writer:
+            yield writer
+
+
+def _new_file_mode() -> int:
+    """Return the mode open() would give a new file under the current umask."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def _fsync_directory(directory: str) -> None:
+    """Flush a directory entry change to disk where the platform allows it."""
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:  # pragma: no cover - directories cannot be opened on Windows
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:  # pragma: no cover - depends on the filesystem
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    """Replace a file's contents in one write, atomically.
+
+    The data goes to a temporary file in the same directory, which is
+    flushed to disk and then renamed over the target, so readers never see
+    a partial file and a crash or power loss leaves either the old or the
+    new contents.
+
+    Args:
+        path: Target file path
+        data: Complete file contents
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates the file owner-only; keep the target's permissions,
+        # or use the umask-derived mode open() would give a new file
+        try:
+            mode = os.stat(path).st_mode & 0o777
+        except FileNotFoundError:
+            mode = _new_file_mode()
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    _fsync_directory(directory)
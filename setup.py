@@ -25,7 +25,11 @@ setup(
             'flake8',
             'mypy',
             'pytest-watch',
-        ]
+        ],
+        'speedups': [
+            'orjson>=3.9',
+            'zstandard>=0.22',
+        ],
     },
     entry_points={
         'console_scripts': [
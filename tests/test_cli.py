@@ -2,8 +2,10 @@
 Tests for the CLI interface.
 """
 
+import json
 import pytest
 from click.testing import CliRunner
+from prompt_manager import PromptManager
 from prompt_manager.cli import cli
 from tests.constants import (
     TASK_TITLE,
@@ -80,6 +82,117 @@ def test_export_tasks(invoke_cli):
     assert f"Tasks exported to {DEFAULT_EXPORT_PATH}" in result.output
 
 
+def test_generate_bolt_tasks_export(invoke_cli, test_data_dir):
+    """Test bolt task generation exports valid JSON."""
+    output = test_data_dir / "bolt_tasks.json"
+    result = invoke_cli(['base', 'generate-bolt-tasks',
+                        TASK_DESCRIPTION,
+                        '--framework', 'react',
+                        '--output', str(output)])
+    assert result.exit_code == 0
+    assert f"Tasks exported to {output}" in result.output
+
+    data = json.loads(output.read_text())
+    assert data["description"] == TASK_DESCRIPTION
+    assert data["framework"] == "react"
+    assert data["tasks"]
+
+
+def test_generate_bolt_tasks_batch(invoke_cli, test_data_dir):
+    """Test batch bolt task generation exports one entry per description."""
+    descriptions = test_data_dir / "descriptions.json"
+    descriptions.write_text(json.dumps(["First app", "Second app"]))
+    output = test_data_dir / "bolt_batch.json"
+    result = invoke_cli(['base', 'generate-bolt-tasks-batch',
+                        str(descriptions),
+                        '--output', str(output)])
+    assert result.exit_code == 0
+    assert "Generated tasks for: Second app" in result.output
+
+    data = json.loads(output.read_text())
+    assert [entry["description"] for entry in data] == ["First app", "Second app"]
+    assert all(entry["tasks"] for entry in data)
+
+
+def test_add_dependencies_batch(invoke_cli, test_data_dir):
+    """Test batch dependency adding rejects cycles without saving."""
+    for title in ("api", "ui", "docs"):
+        assert invoke_cli(['base', 'add-task', title, 'desc']).exit_code == 0
+
+    deps = test_data_dir / "deps.json"
+    deps.write_text(json.dumps([["ui", "api"], {"task": "docs", "dependency": "ui"}]))
+    result = invoke_cli(['base', 'add-dependencies', str(deps)])
+    assert result.exit_code == 0
+    assert "Added 2 dependencies" in result.output
+
+    deps.write_text(json.dumps([["api", "docs"]]))
+    result = invoke_cli(['base', 'add-dependencies', str(deps)])
+    assert result.exit_code != 0
+    assert "Circular dependency detected" in result.output
+
+
+def _seed_cycle(test_data_dir, titles):
+    """Write a dependency cycle through the given tasks straight to tasks.json."""
+    manager = PromptManager(str(test_data_dir))
+    for title, dependency in zip(titles, titles[1:] + titles[:1]):
+        manager.get_task(title).dependencies.append(dependency)
+    manager._save_tasks()
+
+
+def test_add_dependency_downstream_of_cycle(invoke_cli, test_data_dir):
+    """Test an acyclic edge is accepted while another part of the graph has a cycle."""
+    for title in ("a", "b", "c", "p", "q", "x", "y"):
+        assert invoke_cli(['base', 'add-task', title, 'desc']).exit_code == 0
+    _seed_cycle(test_data_dir, ["a", "b", "c"])
+
+    result = invoke_cli(['base', 'add-dependency', 'p', 'q'])
+    assert result.exit_code == 0
+    result = invoke_cli(['base', 'add-dependency', 'q', 'a'])
+    assert result.exit_code == 0
+
+    _seed_cycle(test_data_dir, ["x", "y"])
+    result = invoke_cli(['base', 'add-dependency', 'x', 'p'])
+    assert result.exit_code == 0
+    assert PromptManager(str(test_data_dir)).get_task('x').dependencies == ['y', 'p']
+
+
+def test_add_dependency_closes_cycle(invoke_cli, test_data_dir):
+    """Test the edge that closes a cycle is the one reported."""
+    for title in ("d", "e", "f", "x", "y"):
+        assert invoke_cli(['base', 'add-task', title, 'desc']).exit_code == 0
+    _seed_cycle(test_data_dir, ["x", "y"])
+    assert invoke_cli(['base', 'add-dependency', 'd', 'e']).exit_code == 0
+    assert invoke_cli(['base', 'add-dependency', 'e', 'f']).exit_code == 0
+
+    result = invoke_cli(['base', 'add-dependency', 'f', 'd'])
+    assert result.exit_code != 0
+    assert "Circular dependency detected: 'f' -> 'd'" in result.output
+    assert PromptManager(str(test_data_dir)).get_task('f').dependencies == []
+
+
+def test_add_dependency_duplicate_titles(invoke_cli, test_data_dir):
+    """Test dependencies land on the task that get_task resolves a title to."""
+    for title in ("a", "a", "b"):
+        assert invoke_cli(['base', 'add-task', title, 'desc']).exit_code == 0
+
+    assert invoke_cli(['base', 'add-dependency', 'a', 'b']).exit_code == 0
+    result = invoke_cli(['base', 'list-dependencies', 'a'])
+    assert result.exit_code == 0
+    assert result.output.strip() == "b"
+
+
+def test_list_tasks_status_filter(invoke_cli, test_data_dir):
+    """Test status filtering follows status changes."""
+    for title in ("api", "ui"):
+        assert invoke_cli(['base', 'add-task', title, 'desc']).exit_code == 0
+    PromptManager(str(test_data_dir)).update_task_progress('ui', 'in_progress')
+
+    result = invoke_cli(['base', 'list-tasks', '--status', 'in_progress'])
+    assert result.exit_code == 0
+    assert "in_progress: ui" in result.output
+    assert "api" not in result.output
+
+
 def test_invalid_commands(cli_runner):
     """Test handling of invalid commands and options."""
     # Test invalid command
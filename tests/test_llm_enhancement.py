@@ -200,3 +200,52 @@ def test_generate_reviewer_notes(llm_enhancement):
     assert any("test.py" in note for note in notes)
     assert any("Code style" in note for note in notes)
     assert any("Test coverage" in note for note in notes)
+
+
+def test_generate_tasks_uses_response_cache(memory_bank):
+    """Test identical task generation requests are served from cache."""
+    memory_bank.load_prompt_memory.return_value = {}
+    llm = LLMEnhancement(memory_bank)
+
+    with patch(
+        "prompt_manager.llm_enhancement.get_prompt_for_command"
+    ) as mock_prompt:
+        mock_prompt.return_value = "{description} {framework} {existing_tasks}"
+        first = llm.generate_tasks("Build an app", framework="react")
+        second = llm.generate_tasks("Build an app", framework="react")
+        llm.generate_tasks("Build an app", framework="vue")
+
+    assert first == second
+    assert memory_bank.save_prompt_memory.call_count == 2
+
+
+def test_generate_tasks_cache_returns_copies(memory_bank):
+    """Test changing a returned result does not change later cache hits."""
+    memory_bank.load_prompt_memory.return_value = {}
+    llm = LLMEnhancement(memory_bank)
+
+    with patch(
+        "prompt_manager.llm_enhancement.get_prompt_for_command"
+    ) as mock_prompt:
+        mock_prompt.return_value = "{description} {framework} {existing_tasks}"
+        llm.generate_tasks("Build an app")["tasks"].append("MUTATED")
+        llm.generate_tasks("Build an app")["tasks"].append("MUTATED")
+        third = llm.generate_tasks("Build an app")
+
+    assert "MUTATED" not in third["tasks"]
+
+
+def test_generate_tasks_cache_keyed_by_template(memory_bank):
+    """Test editing the prompt template misses the cache."""
+    memory_bank.load_prompt_memory.return_value = {}
+    llm = LLMEnhancement(memory_bank)
+
+    with patch(
+        "prompt_manager.llm_enhancement.get_prompt_for_command"
+    ) as mock_prompt:
+        mock_prompt.return_value = "{description} {framework} {existing_tasks}"
+        llm.generate_tasks("Build an app")
+        mock_prompt.return_value = "Plan {description} with {framework}. {existing_tasks}"
+        llm.generate_tasks("Build an app")
+
+    assert memory_bank.save_prompt_memory.call_count == 2
@@ -0,0 +1,279 @@
+"""
+Tests for the PromptManager in prompt_manager.manager.
+"""
+
+import json
+import shutil
+import pytest
+import yaml
+from prompt_manager import manager as manager_module
+from prompt_manager.manager import PromptManager
+from prompt_manager.models import TaskStatus
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """Create a manager whose config and task files live in tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    return PromptManager("test_project", memory_path=tmp_path / "cline_docs")
+
+
+@pytest.fixture
+def writes(monkeypatch):
+    """Record the paths written through write_atomic."""
+    paths = []
+    write_atomic = manager_module.write_atomic
+
+    def record_write(path, data):
+        paths.append(path)
+        write_atomic(path, data)
+
+    monkeypatch.setattr(manager_module, "write_atomic", record_write)
+    return paths
+
+
+def test_load_config_yaml(manager, tmp_path):
+    """Test config is read from prompt_config.yaml."""
+    (tmp_path / "prompt_config.yaml").write_text("model: local\nlimits:\n  tasks: 10\n")
+    manager.initialize()
+    assert manager.config == {"model": "local", "limits": {"tasks": 10}}
+
+
+def test_load_config_prefers_json(manager, tmp_path):
+    """Test prompt_config.json wins over prompt_config.yaml."""
+    (tmp_path / "prompt_config.yaml").write_text("model: yaml\n")
+    (tmp_path / "prompt_config.json").write_text(json.dumps({"model": "json"}))
+    manager.initialize()
+    assert manager.config == {"model": "json"}
+
+
+def test_load_config_cache_is_copied(manager, tmp_path):
+    """Test cached config is not shared between managers."""
+    (tmp_path / "prompt_config.yaml").write_text("limits:\n  tasks: 10\n")
+    manager.initialize()
+    manager.config["limits"]["tasks"] = 99
+
+    other = PromptManager("other", memory_path=tmp_path / "cline_docs")
+    other.initialize()
+    assert other.config == {"limits": {"tasks": 10}}
+
+
+def test_save_project_persists_in_place_changes(manager, tmp_path):
+    """Test save_project writes a task that was mutated directly."""
+    task = manager.add_task("api", "Build the API")
+    manager.save_project()
+    task.description = "Build the public API"
+    manager.save_project()
+
+    saved = json.loads((tmp_path / "tasks.json").read_text())
+    assert saved[0]["description"] == "Build the public API"
+
+
+def test_save_tasks_skips_unchanged_write(manager, writes):
+    """Test saving the same tasks twice writes tasks.json once."""
+    manager.add_task("api", "Build the API")
+    manager.save_project()
+    manager.save_project()
+    assert writes == ["tasks.json"]
+
+
+def _log_lines(tmp_path):
+    """Return the decoded entries of tasks.jsonl."""
+    return [json.loads(line) for line in (tmp_path / "tasks.jsonl").read_text().splitlines()]
+
+
+def test_task_log_append(manager, tmp_path):
+    """Test single-task changes are appended to tasks.jsonl."""
+    manager.add_task("api", "Build the API")
+    manager.update_task("api", description="Build the public API")
+
+    entries = _log_lines(tmp_path)
+    assert [entry["op"] for entry in entries] == ["put", "put"]
+    assert entries[-1]["task"]["description"] == "Build the public API"
+    assert not (tmp_path / "tasks.json").exists()
+
+
+def test_task_log_replay(manager, tmp_path):
+    """Test a new manager sees tasks.json plus the logged changes."""
+    manager.add_task("api", "Build the API")
+    manager.save_tasks()
+    manager.add_task("ui", "Build the UI")
+    manager.update_task_status("api", "in_progress")
+
+    reloaded = PromptManager("test_project", memory_path=tmp_path / "cline_docs")
+    assert list(reloaded.tasks) == ["api", "ui"]
+    assert reloaded.get_task("api").status.value == "in_progress"
+
+
+def test_task_log_delete(manager, tmp_path):
+    """Test deletes are logged and replayed."""
+    manager.add_task("api", "Build the API")
+    manager.add_task("ui", "Build the UI")
+    manager.save_tasks()
+    manager.delete_task("api")
+
+    assert _log_lines(tmp_path) == [{"op": "delete", "title": "api"}]
+    reloaded = PromptManager("test_project", memory_path=tmp_path / "cline_docs")
+    assert list(reloaded.tasks) == ["ui"]
+
+
+def test_task_log_compaction(manager, tmp_path, monkeypatch):
+    """Test the log is folded into tasks.json after COMPACT_AFTER entries."""
+    monkeypatch.setattr(manager_module, "COMPACT_AFTER", 3)
+    manager.add_task("api", "Build the API")
+    manager.add_task("ui", "Build the UI")
+    assert len(_log_lines(tmp_path)) == 2
+
+    manager.add_task("docs", "Write the docs")
+    assert not (tmp_path / "tasks.jsonl").exists()
+    saved = json.loads((tmp_path / "tasks.json").read_text())
+    assert [task["title"] for task in saved] == ["api", "ui", "docs"]
+
+
+def test_task_log_torn_tail(manager, tmp_path, caplog):
+    """Test an incomplete last line is skipped on load and compacted away on the next change."""
+    manager.add_task("api", "Build the API")
+    manager.add_task("ui", "Build the UI")
+    log_file = tmp_path / "tasks.jsonl"
+    torn = log_file.read_bytes() + b'{"op": "put", "task": {"title": "do'
+    log_file.write_bytes(torn)
+
+    reloaded = PromptManager("test_project", memory_path=tmp_path / "cline_docs")
+    assert list(reloaded.tasks) == ["api", "ui"]
+    assert "incomplete last line" in caplog.text
+    assert log_file.read_bytes() == torn
+
+    reloaded.add_task("docs", "Write the docs")
+    assert not log_file.exists()
+    again = PromptManager("test_project", memory_path=tmp_path / "cline_docs")
+    assert list(again.tasks) == ["api", "ui", "docs"]
+
+
+@pytest.mark.parametrize("line", [
+    b"not json\n",
+    b"[1, 2]\n",
+    b'{"task": {"title": "docs", "description": ""}}\n',
+    b'{"op": "rename", "title": "api"}\n',
+])
+def test_task_log_invalid_complete_line(manager, tmp_path, line):
+    """Test a complete but invalid line is reported as a ValueError."""
+    manager.add_task("api", "Build the API")
+    log_file = tmp_path / "tasks.jsonl"
+    log_file.write_bytes(log_file.read_bytes() + line)
+
+    reloaded = PromptManager("test_project", memory_path=tmp_path / "cline_docs")
+    with pytest.raises(ValueError, match="line 2 of tasks.jsonl"):
+        reloaded.initialize()
+
+
+def test_batch_saves_once(manager, tmp_path):
+    """Test changes inside batch() are saved once as a full tasks.json."""
+    with manager.batch():
+        manager.add_task("api", "Build the API")
+        manager.add_task("ui", "Build the UI")
+        assert not (tmp_path / "tasks.json").exists()
+        assert not (tmp_path / "tasks.jsonl").exists()
+
+    saved = json.loads((tmp_path / "tasks.json").read_text())
+    assert [task["title"] for task in saved] == ["api", "ui"]
+    assert not (tmp_path / "tasks.jsonl").exists()
+
+
+def test_update_markdown_files(manager, tmp_path):
+    """Test the four markdown files render from the current tasks."""
+    manager.add_task("api", "Build the API", priority="low")
+    manager.add_task("ui", "Build the UI", priority="high")
+    manager.update_task_status("api", "in_progress", "Started on the routes")
+    manager.update_markdown_files()
+
+    plan = (tmp_path / "project_plan.md").read_text()
+    assert plan.startswith("# test_project Project Plan\n\n")
+    assert plan.index("## ui") < plan.index("## api")
+
+    breakdown = (tmp_path / "task_breakdown.md").read_text()
+    assert "## api\n- Status: in_progress\n- Priority: low\n\n" in breakdown
+
+    progress = (tmp_path / "progress_tracking.md").read_text()
+    assert "### Notes:\n" in progress
+    assert "Started on the routes" in progress
+
+    diagrams = (tmp_path / "mermaid_diagrams.md").read_text()
+    assert "    api[api] --> in_progress\n" in diagrams
+    assert '    "high" : 1\n' in diagrams
+
+
+def test_update_markdown_files_skips_unchanged(manager, writes):
+    """Test only markdown files whose content changed are rewritten."""
+    manager.add_task("api", "Build the API")
+    manager.update_markdown_files()
+    writes.clear()
+
+    manager.update_markdown_files()
+    assert writes == []
+
+    manager.get_task("api").description = "Build the public API"
+    manager.update_markdown_files()
+    assert writes == ["project_plan.md"]
+
+
+def test_list_tasks_status_after_direct_change(manager):
+    """Test status filtering sees a status set directly on a task."""
+    manager.add_task("api", "Build the API")
+    manager.add_task("ui", "Build the UI")
+    assert [task.title for task in manager.list_tasks(status=TaskStatus.PENDING)] == ["api", "ui"]
+
+    manager.get_task("ui").status = TaskStatus.IN_PROGRESS
+    assert [task.title for task in manager.list_tasks(status=TaskStatus.PENDING)] == ["api"]
+    assert [task.title for task in manager.list_tasks(status=TaskStatus.IN_PROGRESS)] == ["ui"]
+
+
+def test_config_loads_without_tasks_access(tmp_path, monkeypatch):
+    """Test config is read on first access without touching the tasks."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "prompt_config.yaml").write_text("model: local\n")
+    manager = PromptManager("test_project", memory_path=tmp_path / "cline_docs")
+    assert manager.config == {"model": "local"}
+
+
+def test_memory_bank_recreated_after_removal(manager, tmp_path):
+    """Test a new manager recreates a memory directory removed in between."""
+    memory_dir = tmp_path / "cline_docs" / "memory"
+    assert memory_dir.is_dir()
+    shutil.rmtree(memory_dir)
+
+    PromptManager("test_project", memory_path=tmp_path / "cline_docs")
+    assert (memory_dir / "context.json").exists()
+
+
+def test_export_yaml_single_document(manager, tmp_path):
+    """Test YAML exports stay one list document that safe_load can read."""
+    manager.add_task("api", "Build the API")
+    manager.add_task("ui", "Build the UI")
+    export = tmp_path / "export.yaml"
+    manager.export_tasks(export)
+
+    data = yaml.safe_load(export.read_text())
+    assert [task["title"] for task in data] == ["api", "ui"]
+
+
+def test_import_yaml_document_forms(manager, tmp_path):
+    """Test YAML imports accept a list document and a stream of task documents."""
+    listed = tmp_path / "listed.yaml"
+    listed.write_text(yaml.safe_dump([{"title": "api", "description": "Build the API"}]))
+    streamed = tmp_path / "streamed.yaml"
+    streamed.write_text(yaml.safe_dump_all([
+        {"title": "ui", "description": "Build the UI"},
+        {"title": "docs", "description": "Write the docs"},
+    ]))
+
+    manager.import_tasks(listed)
+    manager.import_tasks(streamed)
+    assert list(manager.tasks) == ["api", "ui", "docs"]
+
+
+@pytest.mark.parametrize("sort_by", ["created", "updated", "title"])
+def test_list_tasks_rejects_unsupported_sort(manager, sort_by):
+    """Test sort keys the task model cannot support raise ValueError."""
+    manager.add_task("api", "Build the API")
+    with pytest.raises(ValueError, match="Invalid sort key"):
+        manager.list_tasks(sort_by=sort_by)
@@ -0,0 +1,64 @@
+"""
+Tests for the serialization helpers.
+"""
+
+import os
+import stat
+import sys
+
+import pytest
+from prompt_manager.serialization import dumps, loads, open_output, write_atomic
+
+PAYLOAD = {"description": "Test export", "tasks": ["api", "ui"]}
+
+
+def test_open_output_plain(tmp_path):
+    """Test non-.zst paths are written uncompressed."""
+    output = tmp_path / "tasks.json"
+    with open_output(str(output)) as f:
+        f.write(dumps(PAYLOAD))
+
+    assert loads(output.read_bytes()) == PAYLOAD
+
+
+def test_open_output_zst(tmp_path):
+    """Test .zst paths are written as a zstd frame."""
+    zstandard = pytest.importorskip("zstandard")
+    output = tmp_path / "tasks.json.zst"
+    with open_output(str(output)) as f:
+        f.write(dumps(PAYLOAD))
+
+    raw = output.read_bytes()
+    assert raw.startswith(b"\x28\xb5\x2f\xfd")
+    with zstandard.ZstdDecompressor().stream_reader(raw) as reader:
+        assert loads(reader.read()) == PAYLOAD
+
+
+def test_open_output_zst_without_zstandard(tmp_path, monkeypatch):
+    """Test .zst paths name the right extra when zstandard is missing."""
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+    with pytest.raises(ValueError, match=r"tosins-prompt-manager\[speedups\]"):
+        with open_output(str(tmp_path / "tasks.json.zst")):
+            pass
+
+
+def test_write_atomic_new_file_follows_umask(tmp_path):
+    """Test new files get the mode open() would give them under the umask."""
+    old_umask = os.umask(0o077)
+    try:
+        write_atomic(str(tmp_path / "tasks.json"), b"{}")
+    finally:
+        os.umask(old_umask)
+
+    assert stat.S_IMODE(os.stat(tmp_path / "tasks.json").st_mode) == 0o600
+
+
+def test_write_atomic_keeps_existing_mode(tmp_path):
+    """Test replacing a file keeps its permissions."""
+    target = tmp_path / "tasks.json"
+    target.write_bytes(b"{}")
+    os.chmod(target, 0o640)
+    write_atomic(str(target), b'{"a": 1}')
+
+    assert target.read_bytes() == b'{"a": 1}'
+    assert stat.S_IMODE(os.stat(target).st_mode) == 0o640
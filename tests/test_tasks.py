@@ -0,0 +1,30 @@
+"""
+Tests for the JSON task store in prompt_manager.PromptManager.
+"""
+
+from prompt_manager import PromptManager, TaskStatus
+
+
+def test_list_tasks_by_status_after_direct_change(test_data_dir):
+    """Test a status set directly on a task is seen by list_tasks_by_status."""
+    manager = PromptManager(str(test_data_dir))
+    manager.add_task("api", "desc")
+    ui = manager.add_task("ui", "desc")
+    manager.update_task_progress("api", "in_progress")
+    ui.status = TaskStatus.in_progress
+
+    assert [t.title for t in manager.list_tasks_by_status(TaskStatus.in_progress)] == ["api", "ui"]
+    assert manager.list_tasks_by_status(TaskStatus.not_started) == []
+
+
+def test_save_keeps_direct_edits_to_other_tasks(test_data_dir):
+    """Test a save triggered by one task also writes edits made directly on another."""
+    manager = PromptManager(str(test_data_dir))
+    a = manager.add_task("a", "d")
+    manager.add_task("b", "d")
+    a.description = "changed directly"
+    manager.update_task_progress("b", "in_progress")
+
+    reloaded = PromptManager(str(test_data_dir))
+    assert reloaded.get_task("a").description == "changed directly"
+    assert reloaded.get_task("b").status is TaskStatus.in_progress